@@ -1,17 +1,70 @@
 import json
-from typing import List, Dict, Optional
+import os
+import sys
+from typing import List, Dict, Optional, Tuple
 
 
 class MenuItem:
     """Класс для представления элемента меню."""
 
+    __slots__ = ("name", "price", "category", "_str")
+
     def __init__(self, name: str, price: float, category: str):
         self.name = name
         self.price = price
         self.category = category
+        self._str: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MenuItem":
+        """
+        Создает элемент меню из словаря JSON, проверяя поля и их типы.
+        При некорректных данных выбрасывает ValueError.
+        """
+        try:
+            name, price, category = data["name"], data["price"], data["category"]
+        except KeyError as error:
+            raise ValueError(f"У элемента меню нет поля {error}") from None
+        if (
+            not isinstance(name, str)
+            or not isinstance(category, str)
+            or not isinstance(price, (int, float))
+            or isinstance(price, bool)
+        ):
+            raise ValueError(f"Некорректный элемент меню: {data}")
+        # Категории и названия повторяются, интернирование оставляет одну копию каждой строки
+        return cls(sys.intern(name), price, sys.intern(category))
+
+    def __str__(self):
+        # Строка элемента меню не меняется, поэтому форматируем ее один раз
+        if self._str is None:
+            self._str = f"{self.name} ({self.category}) - {self.price} руб."
+        return self._str
+
+    def to_entry(self):
+        """Возвращает позицию заказа для сохранения: только название, цена и категория есть в меню."""
+        return self.name
+
+
+class OffMenuItem(MenuItem):
+    """Позиция заказа, которой нет в меню. Сохраняется целиком, чтобы не потерять цену."""
+
+    __slots__ = ()
+
+    def to_entry(self):
+        return {"name": self.name, "price": self.price, "category": self.category}
+
+
+class UnresolvedItem(MenuItem):
+    """Позиция заказа, известная только по названию: в меню ее нет, цена неизвестна и не учитывается."""
+
+    __slots__ = ()
+
+    def __init__(self, name: str):
+        super().__init__(name, 0, "")
 
     def __str__(self):
-        return f"{self.name} ({self.category}) - {self.price} руб."
+        return f"{self.name} (нет в меню)"
 
 
 class Menu:
@@ -19,49 +72,55 @@ class Menu:
 
     def __init__(self):
         self.items: List[MenuItem] = []
+        self._by_name: Dict[str, MenuItem] = {}
+        # Индексы отдаются наружу, поэтому хранятся кортежами, которые нельзя испортить изменением
+        self._by_category: Dict[str, Tuple[MenuItem, ...]] = {}
+        self._categories: Tuple[str, ...] = ()
 
     def load_menu(self, filename: str) -> None:
         """Загружает меню из JSON-файла."""
         try:
             with open(filename, "r", encoding="utf-8") as file:
-                menu_data = json.load(file)
-                self.items = [
-                    MenuItem(item["name"], item["price"], item["category"])
-                    for item in menu_data
-                ]
+                # Элементы меню создаются прямо во время разбора, без промежуточного списка словарей
+                # и сразу проверяются, поэтому при ошибке текущее меню остается прежним
+                items = json.load(file, object_hook=MenuItem.from_dict)
+                if not isinstance(items, list) or not all(isinstance(item, MenuItem) for item in items):
+                    raise ValueError("Меню должно быть списком элементов меню")
+                self.items = items
+                self._by_name = {}
+                by_category: Dict[str, List[MenuItem]] = {}
+                for item in self.items:
+                    self._by_name.setdefault(item.name, item)  # При повторе имени берется первое
+                    by_category.setdefault(item.category, []).append(item)
+                # Словарь сохраняет порядок вставки, поэтому категории идут в порядке появления
+                self._by_category = {category: tuple(items) for category, items in by_category.items()}
+                self._categories = tuple(self._by_category)
             print("Меню успешно загружено.")
         except FileNotFoundError:
             print("Файл меню не найден.")
-        except json.JSONDecodeError:
+        except ValueError:  # В том числе json.JSONDecodeError
             print("Ошибка чтения файла меню.")
 
     def show_menu(self, category: Optional[str] = None) -> None:
         """Показывает меню, возможно, отфильтрованное по категории."""
-        print("Меню:")
-        for item in self.items:
-            if category is None or item.category == category:
-                print(item)
+        # Собираем все строки и выводим их одним вызовом print
+        # Выбираем список один раз, чтобы в цикле по блюдам не было проверки категории
+        items = self.items if category is None else self._by_category.get(category, ())
+        lines = ["Меню:"]
+        lines.extend(map(str, items))
+        print("\n".join(lines))
 
-    def get_items_by_category(self, category: str) -> List[MenuItem]:
-        """Возвращает список блюд по категории."""
-        return [item for item in self.items if item.category == category]
+    def get_items_by_category(self, category: str) -> Tuple[MenuItem, ...]:
+        """Возвращает блюда категории (кортеж из индекса меню, без копирования)."""
+        return self._by_category.get(category, ())
 
     def get_item_by_name(self, name: str) -> Optional[MenuItem]:
         """Возвращает элемент меню по имени. Если элемент не найден, возвращает None."""
-        for item in self.items:
-            if item.name == name:
-                return item
-        return None
-
-    def get_categories(self) -> List[str]:
-        """Возвращает список всех категорий в меню в порядке их появления."""
-        categories = []
-        seen = set()
-        for item in self.items:
-            if item.category not in seen:
-                categories.append(item.category)
-                seen.add(item.category)
-        return categories
+        return self._by_name.get(name)
+
+    def get_categories(self) -> Tuple[str, ...]:
+        """Возвращает все категории меню в порядке их появления."""
+        return self._categories
 
 
 class Order:
@@ -71,39 +130,54 @@ class Order:
         self.table_number = table_number
         self.customer_name = customer_name
         self.items: List[MenuItem] = []
+        self._total: float = 0
 
     def add_item(self, item: MenuItem) -> None:
         """Добавляет элемент в заказ."""
         self.items.append(item)
+        self._total += item.price
 
     def remove_item(self, item_name: str) -> None:
         """Удаляет элемент из заказа по имени."""
-        self.items = [item for item in self.items if item.name != item_name]
+        # Один проход: оставшиеся позиции и их сумма собираются вместе
+        remaining = []
+        total: float = 0
+        for item in self.items:
+            if item.name != item_name:
+                remaining.append(item)
+                total += item.price
+        if len(remaining) == len(self.items):
+            return  # Такого блюда в заказе нет, сумма не меняется
+        self.items = remaining
+        # Сумма пересчитывается заново, чтобы не накапливать ошибку округления при вычитании
+        self._total = total
 
     def show_order(self) -> None:
         """Показывает текущий заказ."""
         if not self.items:
             print("Заказ пуст.")
         else:
-            print(f"Заказ для стола №{self.table_number} (клиент: {self.customer_name}):")
-            for item in self.items:
-                print(item)
-            print(f"Общая сумма: {self.total_price()} руб.")
+            lines = [f"Заказ для стола №{self.table_number} (клиент: {self.customer_name}):"]
+            lines.extend(map(str, self.items))
+            lines.append(f"Общая сумма: {self.total_price()} руб.")
+            print("\n".join(lines))
 
     def total_price(self) -> float:
         """Возвращает общую сумму заказа."""
-        return sum(item.price for item in self.items)
+        return self._total
 
     def clear_order(self) -> None:
         """Очищает заказ."""
         self.items = []
+        self._total = 0
 
     def to_dict(self) -> Dict:
         """Преобразует заказ в словарь для сохранения в JSON."""
         return {
             "table_number": self.table_number,
             "customer_name": self.customer_name,
-            "items": [{"name": item.name, "price": item.price, "category": item.category} for item in self.items],
+            # Позиции из меню хранятся по названию, цена и категория берутся из меню при загрузке
+            "items": [item.to_entry() for item in self.items],
         }
 
 
@@ -113,18 +187,42 @@ class Restaurant:
     def __init__(self):
         self.menu = Menu()
         self.orders: Dict[int, Order] = {}
-        self.available_tables = {1, 2, 3, 4, 5}  # Пример списка столиков
+        # Свободные столики как битовая маска: бит i означает столик №(i + 1)
+        self._all_mask = 0b11111  # Пример списка столиков: 1-5
+        self._free_mask = self._all_mask
+        self._hotkey_to_category: Dict[str, str] = {}  # Клавиша выбора -> категория
+        self._category_listing = ""  # Готовый текст списка категорий
+        self._orders_filename: Optional[str] = None  # Файл снимка заказов, к которому ведется журнал
+        self._journal = None  # Журнал изменений заказов, открыт после load_orders
+        self._seq = 0  # Номер последнего изменения заказов, учтенного в памяти
 
     def load_menu(self, filename: str) -> None:
         """Загружает меню из файла."""
         self.menu.load_menu(filename)
+        # Категории могли измениться, клавиши выбора будут построены заново
+        self._hotkey_to_category = {}
+        self._category_listing = ""
+
+    def _build_category_hotkeys(self, categories: Tuple[str, ...]) -> None:
+        """Строит соответствие клавиш выбора категориям и текст списка категорий."""
+        russian_letters = "АБВГДЕЖЗИКЛМНОПРСТУФХЦЧШЩЭЮЯ"  # Русские буквы для обозначения категорий
+        lines = ["\nВыберите категорию:"]
+        for i, category in enumerate(categories):
+            number = str(i + 1)
+            self._hotkey_to_category[number] = category
+            if i < len(russian_letters):
+                self._hotkey_to_category[russian_letters[i]] = category
+                lines.append(f"{russian_letters[i]}. {category}")
+            else:
+                lines.append(f"{number}. {category}")  # Если категорий больше, чем букв, используем числа
+        self._category_listing = "\n".join(lines)
 
     def create_order(self, table_number: int, customer_name: str) -> bool:
         """
         Создает новый заказ для стола, если он свободен.
         Возвращает True, если заказ создан, и False, если нет.
         """
-        if table_number not in self.available_tables:
+        if not self._is_table_free(table_number):
             print(f"Столик №{table_number} не существует.")
             return False
 
@@ -133,7 +231,8 @@ class Restaurant:
             return False
 
         self.orders[table_number] = Order(table_number, customer_name)
-        self.available_tables.remove(table_number)
+        self._occupy_table(table_number)
+        self._write_journal({"op": "create", "table": table_number, "customer": customer_name})
         print(f"Заказ для стола №{table_number} создан на имя {customer_name}.")
         return True
 
@@ -146,6 +245,7 @@ class Restaurant:
         item = self.menu.get_item_by_name(item_name)
         if item:
             self.orders[table_number].add_item(item)
+            self._write_journal({"op": "add", "table": table_number, "item": item_name})
             print(f"{item_name} добавлен в заказ для стола №{table_number}.")
         else:
             print(f"Элемент '{item_name}' не найден в меню.")
@@ -157,6 +257,7 @@ class Restaurant:
             return
 
         self.orders[table_number].remove_item(item_name)
+        self._write_journal({"op": "remove", "table": table_number, "item": item_name})
         print(f"{item_name} удален из заказа для стола №{table_number}.")
 
     def show_order(self, table_number: int) -> None:
@@ -173,40 +274,238 @@ class Restaurant:
         else:
             self.orders[table_number].clear_order()
             del self.orders[table_number]
-            self.available_tables.add(table_number)
+            self._release_table(table_number)
+            self._write_journal({"op": "cancel", "table": table_number})
             print(f"Заказ для стола №{table_number} отменен.")
 
+    def _table_exists(self, table_number: int) -> bool:
+        """Проверяет, что номер столика входит в список столиков ресторана."""
+        return 0 < table_number <= self._all_mask.bit_length()
+
+    def _is_table_free(self, table_number: int) -> bool:
+        """Проверяет, свободен ли столик."""
+        return self._table_exists(table_number) and bool((self._free_mask >> (table_number - 1)) & 1)
+
+    def _occupy_table(self, table_number: int) -> None:
+        """Помечает столик как занятый."""
+        if self._table_exists(table_number):
+            self._free_mask &= ~(1 << (table_number - 1))
+
+    def _release_table(self, table_number: int) -> None:
+        """Помечает столик как свободный."""
+        if self._table_exists(table_number):
+            self._free_mask = (self._free_mask | 1 << (table_number - 1)) & self._all_mask
+
+    def _free_tables(self):
+        """Перебирает номера свободных столиков по возрастанию."""
+        mask = self._free_mask
+        while mask:
+            lowest = mask & -mask  # Младший установленный бит
+            yield lowest.bit_length()
+            mask ^= lowest
+
     def show_available_tables(self) -> None:
         """Показывает свободные столики."""
-        print("Свободные столики:", ", ".join(map(str, sorted(self.available_tables))))
+        print("Свободные столики:", ", ".join(map(str, self._free_tables())))
 
     def save_orders(self, filename: str) -> None:
-        """Сохраняет все заказы в файл."""
-        orders_data = [order.to_dict() for order in self.orders.values()]
-        with open(filename, "w", encoding="utf-8") as file:
-            json.dump(orders_data, file, ensure_ascii=False, indent=4)
+        """
+        Сохраняет все заказы в файл.
+        Снимок записывается во временный файл и атомарно подменяет старый, вместе с ним
+        сохраняется номер последнего учтенного изменения. Полный снимок поглощает журнал,
+        поэтому журнал после него очищается.
+        """
+        orders_data = {"seq": self._seq, "orders": [order.to_dict() for order in self.orders.values()]}
+        temp_filename = filename + ".tmp"
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            # Одна запись вместо множества мелких, которые делает json.dump
+            file.write(json.dumps(orders_data, ensure_ascii=False, indent=4))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_filename, filename)
+        if self._journal is not None and filename == self._orders_filename:
+            self._journal.seek(0)
+            self._journal.truncate()
         print("Заказы успешно сохранены.")
 
     def load_orders(self, filename: str) -> None:
-        """Загружает заказы из файла."""
+        """
+        Загружает заказы из файла и применяет к ним журнал изменений.
+        Позиции заказов ищутся в меню, поэтому меню загружается раньше.
+        Уже загруженные заказы заменяются, так что повторный вызов не применяет журнал дважды.
+        """
+        self.orders = {}
+        self._free_mask = self._all_mask
+        self._seq = 0
         try:
             with open(filename, "r", encoding="utf-8") as file:
-                orders_data = json.load(file)
+                data = json.load(file, object_hook=self._decode_order_object)
+                # Старый формат снимка - просто список заказов, без номера изменения
+                if isinstance(data, dict) and "orders" in data:
+                    seq, orders_data = data["seq"], data["orders"]
+                else:
+                    seq, orders_data = 0, data
+                # Проверенные заказы остаются словарями, все остальное - ошибка формата
+                if not isinstance(orders_data, list) or not all(
+                    isinstance(order_data, dict) and "table_number" in order_data for order_data in orders_data
+                ):
+                    raise ValueError("Заказы должны быть списком заказов")
                 for order_data in orders_data:
                     table_number = order_data["table_number"]
                     customer_name = order_data["customer_name"]
                     order = Order(table_number, customer_name)
-                    for item_data in order_data["items"]:
-                        item = MenuItem(item_data["name"], item_data["price"], item_data["category"])
-                        order.add_item(item)
+                    for entry in order_data["items"]:
+                        # Старый формат хранил позицию целиком, новый - только название
+                        name = entry.name if isinstance(entry, MenuItem) else entry
+                        item = self.menu.get_item_by_name(name)
+                        if item:
+                            order.add_item(item)
+                        elif isinstance(entry, MenuItem):
+                            # Позиция сохранена целиком, поэтому цена известна и без меню
+                            order.add_item(OffMenuItem(entry.name, entry.price, entry.category))
+                        else:
+                            print(f"Элемент '{name}' не найден в меню.")
+                            order.add_item(UnresolvedItem(name))
                     self.orders[table_number] = order
-                    self.available_tables.discard(table_number)
+                    self._occupy_table(table_number)
+                self._seq = seq
             print("Заказы успешно загружены.")
         except FileNotFoundError:
             print("Файл заказов не найден.")
-        except json.JSONDecodeError:
+        except ValueError:  # В том числе json.JSONDecodeError
             print("Ошибка чтения файла заказов.")
 
+        # Изменения, сделанные после последнего снимка, восстанавливаются из журнала
+        journal_filename = self._journal_filename(filename)
+        self._replay_journal(journal_filename)
+        self.close()
+        self._orders_filename = filename
+        self._journal = open(journal_filename, "a", encoding="utf-8")
+
+    @staticmethod
+    def _journal_filename(filename: str) -> str:
+        """Возвращает имя файла журнала для файла заказов (orders.json -> orders.log)."""
+        return os.path.splitext(filename)[0] + ".log"
+
+    def _write_journal(self, entry: Dict) -> None:
+        """Дописывает одно изменение заказов в журнал."""
+        if self._journal is None:
+            return
+        self._seq += 1
+        entry["seq"] = self._seq
+        self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._journal.flush()
+
+    def _replay_journal(self, journal_filename: str) -> None:
+        """
+        Применяет к загруженным заказам изменения из журнала.
+        Записи, которые уже вошли в снимок (номер не больше номера снимка), пропускаются.
+        Недописанный хвост журнала обрезается, чтобы новые записи не склеились с ним.
+        """
+        count = 0
+        skipped = 0
+        try:
+            with open(journal_filename, "r+b") as file:
+                good_offset = 0  # Конец последней целой строки
+                for line in file:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("Недописанная строка")
+                        entry = json.loads(line) if line.strip() else None
+                    except ValueError:  # В том числе json.JSONDecodeError и UnicodeDecodeError
+                        break  # Недописанная строка в конце журнала
+                    good_offset += len(line)
+                    if entry is None or (
+                        isinstance(entry, dict) and isinstance(entry.get("seq"), int) and entry["seq"] <= self._seq
+                    ):
+                        continue  # Пустая строка или изменение, уже учтенное в снимке
+                    if self._apply_journal_entry(entry):
+                        count += 1
+                    else:
+                        skipped += 1
+                file.truncate(good_offset)
+        except FileNotFoundError:
+            return
+        if count:
+            print(f"Восстановлено изменений из журнала: {count}.")
+        if skipped:
+            print(f"Пропущено некорректных записей журнала: {skipped}.")
+
+    def _apply_journal_entry(self, entry) -> bool:
+        """
+        Применяет одно изменение из журнала без вывода сообщений.
+        Возвращает False, если запись имеет неверный формат.
+        """
+        if (
+            not isinstance(entry, dict)
+            or not isinstance(entry.get("table"), int)
+            or isinstance(entry.get("table"), bool)
+            or not isinstance(entry.get("seq"), int)
+            or isinstance(entry.get("seq"), bool)
+        ):
+            return False
+        op = entry.get("op")
+        if op == "create":
+            if not isinstance(entry.get("customer"), str):
+                return False
+        elif op in ("add", "remove"):
+            if not isinstance(entry.get("item"), str):
+                return False
+        elif op != "cancel":
+            return False
+
+        table_number = entry["table"]
+        if op == "create":
+            if table_number not in self.orders:
+                self.orders[table_number] = Order(table_number, entry["customer"])
+                self._occupy_table(table_number)
+        elif table_number in self.orders:
+            if op == "add":
+                item = self.menu.get_item_by_name(entry["item"])
+                if item:
+                    self.orders[table_number].add_item(item)
+                else:
+                    self.orders[table_number].add_item(UnresolvedItem(entry["item"]))
+            elif op == "remove":
+                self.orders[table_number].remove_item(entry["item"])
+            else:
+                del self.orders[table_number]
+                self._release_table(table_number)
+        self._seq = entry["seq"]
+        return True
+
+    def close(self) -> None:
+        """Закрывает журнал заказов."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    @staticmethod
+    def _decode_order_object(data: Dict):
+        """
+        Превращает позиции заказа старого формата (словари) в MenuItem прямо во время
+        разбора JSON и проверяет структуру самих заказов и снимка.
+        """
+        if "orders" in data:
+            if (
+                not isinstance(data.get("seq"), int)
+                or isinstance(data["seq"], bool)
+                or not isinstance(data["orders"], list)
+            ):
+                raise ValueError(f"Некорректный снимок заказов: {data}")
+            return data
+        if "table_number" not in data:
+            return MenuItem.from_dict(data)
+        if (
+            not isinstance(data["table_number"], int)
+            or isinstance(data["table_number"], bool)
+            or not isinstance(data.get("customer_name"), str)
+            or not isinstance(data.get("items"), list)
+            or not all(isinstance(item, (str, MenuItem)) for item in data["items"])
+        ):
+            raise ValueError(f"Некорректный заказ: {data}")
+        return data
+
     def show_category_menu(self) -> Optional[str]:
         """Показывает меню категорий и возвращает выбранную категорию."""
         categories = self.menu.get_categories()
@@ -214,32 +513,20 @@ class Restaurant:
             print("Категории не найдены.")
             return None
 
-        print("\nВыберите категорию:")
-        russian_letters = "АБВГДЕЖЗИКЛМНОПРСТУФХЦЧШЩЭЮЯ"  # Русские буквы для обозначения категорий
-        for i, category in enumerate(categories):
-            if i < len(russian_letters):
-                print(f"{russian_letters[i]}. {category}")
-            else:
-                print(f"{i + 1}. {category}")  # Если категорий больше, чем букв, используем числа
+        if not self._hotkey_to_category:
+            self._build_category_hotkeys(categories)
+        print(self._category_listing)
 
         choice = input("Введите букву или номер категории (или 0 чтобы выйти): ").strip().upper()
 
         if choice == "0":
             return None
 
-        # Проверяем, является ли выбор буквой
-        if choice in russian_letters:
-            index = russian_letters.index(choice)
-            if index < len(categories):
-                return categories[index]
-        # Проверяем, является ли выбор числом
-        elif choice.isdigit():
-            index = int(choice) - 1
-            if 0 <= index < len(categories):
-                return categories[index]
-
-        print("Неверный выбор.")
-        return None
+        # Выбор может быть буквой или номером категории
+        category = self._hotkey_to_category.get(choice)
+        if category is None:
+            print("Неверный выбор.")
+        return category
 
     def order_creation_wizard(self) -> None:
         """Пошаговый мастер создания заказа."""
@@ -253,7 +540,7 @@ class Restaurant:
             return
 
         # Проверка существования и занятости столика
-        if table_number not in self.available_tables:
+        if not self._is_table_free(table_number):
             if table_number in self.orders:
                 print(f"Столик №{table_number} уже занят.")
             else:
@@ -271,20 +558,21 @@ class Restaurant:
             if category is None:
                 break  # Выход из цикла, если пользователь выбрал "0"
 
-            print(f"\nВыберите блюдо из категории '{category}':")
+            lines = [f"\nВыберите блюдо из категории '{category}':"]
             items = self.menu.get_items_by_category(category)
-            for i, item in enumerate(items, 1):
-                print(f"{i}. {item}")
+            lines.extend(f"{i}. {item}" for i, item in enumerate(items, 1))
+            print("\n".join(lines))
             choice = input("Введите номер блюда (или 0 чтобы пропустить): ")
-            if choice.isdigit() and 0 < int(choice) <= len(items):
-                selected_item = items[int(choice) - 1]
+            try:
+                index = int(choice) - 1
+            except ValueError:
+                index = -1
+            if 0 <= index < len(items):
+                selected_item = items[index]
                 self.add_to_order(table_number, selected_item.name)
             else:
                 print("Категория пропущена.")
 
-        # Сохранение заказов
-        self.save_orders("orders.json")
-
 
 def main():
     """Основная функция для взаимодействия с пользователем."""
@@ -292,6 +580,28 @@ def main():
     restaurant.load_menu("menu.json")  # Загрузка меню из файла
     restaurant.load_orders("orders.json")  # Загрузка заказов из файла
 
+    def show_menu() -> None:
+        category = restaurant.show_category_menu()
+        if category:
+            restaurant.menu.show_menu(category)
+
+    def show_order() -> None:
+        table_number = int(input("Введите номер стола: "))
+        restaurant.show_order(table_number)
+
+    def cancel_order() -> None:
+        table_number = int(input("Введите номер стола: "))
+        restaurant.cancel_order(table_number)  # Отмена сразу попадает в журнал заказов
+
+    # Действия меню по номеру; выход обрабатывается отдельно, так как завершает цикл
+    actions = {
+        "1": restaurant.order_creation_wizard,
+        "2": show_menu,
+        "3": show_order,
+        "4": cancel_order,
+        "5": restaurant.show_available_tables,
+    }
+
     while True:
         print("\n1. Создать заказ")
         print("2. Показать меню")
@@ -302,31 +612,15 @@ def main():
 
         choice = input("Выберите действие: ")
 
-        if choice == "1":
-            restaurant.order_creation_wizard()
-
-        elif choice == "2":
-            category = restaurant.show_category_menu()
-            if category:
-                restaurant.menu.show_menu(category)
-
-        elif choice == "3":
-            table_number = int(input("Введите номер стола: "))
-            restaurant.show_order(table_number)
-
-        elif choice == "4":
-            table_number = int(input("Введите номер стола: "))
-            restaurant.cancel_order(table_number)
-            restaurant.save_orders("orders.json")  # Сохранение заказов в файл
-
-        elif choice == "5":
-            restaurant.show_available_tables()
-
-        elif choice == "6":
+        if choice == "6":
             restaurant.save_orders("orders.json")  # Сохранение заказов перед выходом
+            restaurant.close()
             print("Выход из программы.")
             break
 
+        action = actions.get(choice)
+        if action:
+            action()
         else:
             print("Неверный выбор. Пожалуйста, выберите действие от 1 до 6.")
 